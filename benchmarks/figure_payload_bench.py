@@ -0,0 +1,133 @@
+"""Payload size / serialization time per chart figure.
+
+Builds figures from synthetic price series (no network) and serializes them
+the way Dash does (plotly.io.json.to_json_plotly), once per JSON engine
+("json", plus "orjson" if installed), for:
+- plain:   the go.Figure as returned by create_price_figure
+- compact: compact_figure(fig) (numeric x/y as base64 typed arrays)
+Sizes are reported raw and after gzip / brotli (brotli only if installed).
+
+Before timing, the typed-array encoding is checked by decoding it back
+(exits with an AssertionError on mismatch).
+
+Usage (from the repo root):
+    python benchmarks/figure_payload_bench.py
+    python benchmarks/figure_payload_bench.py --points 500 5000 50000 --repeat 20
+"""
+from __future__ import annotations
+
+import argparse
+import base64
+import gzip
+import importlib.util
+import os
+import statistics
+import sys
+import time
+from typing import Callable, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+import plotly.graph_objects as go  # noqa: E402
+from plotly.io.json import to_json_plotly  # noqa: E402
+
+from py_components.chart_factory import create_price_figure  # noqa: E402
+from py_components.figure_serializer import compact_figure, encode_typed_array  # noqa: E402
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ENGINES = ["json"] + (["orjson"] if importlib.util.find_spec("orjson") else [])
+
+
+def _synthetic_frame(points: int) -> pd.DataFrame:
+    rng = np.random.default_rng(42)
+    ts = pd.date_range("2024-01-01", periods=points, freq="min")
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 1e-3, points)))
+    return pd.DataFrame({"ts": ts, "Close": close})
+
+
+def _check(cond: bool, msg: str) -> None:
+    if not cond:
+        raise AssertionError(msg)
+
+
+def _decode(typed: dict) -> np.ndarray:
+    return np.frombuffer(base64.b64decode(typed["bdata"]), "<" + typed["dtype"])
+
+
+def check_encoding() -> None:
+    """Round-trip checks for figure_serializer."""
+    # Price chart: y decodes back to the source, datetime x is left untouched
+    df = _synthetic_frame(50)
+    trace = compact_figure(create_price_figure(df, ticker="SYN-USD"))["data"][0]
+    _check(trace["y"]["dtype"] == "f8", "y should be encoded as f8")
+    _check(np.array_equal(_decode(trace["y"]), df["Close"].to_numpy()),
+           "decoded y differs from source Close")
+    _check(not isinstance(trace["x"], dict), "datetime x must not be typed-array encoded")
+
+    # int64 is not a plotly.js typed array: sent as float64
+    ints = np.arange(10, dtype="int64")
+    typed = encode_typed_array(ints)
+    _check(typed["dtype"] == "f8", "int64 should be sent as f8")
+    _check(np.array_equal(_decode(typed), ints.astype("float64")), "int64 round-trip failed")
+
+    # Bool / string (object) arrays pass through unchanged
+    labels, flags = ["a", "b", "c"], [True, False, True]
+    trace = compact_figure(go.Figure(go.Scatter(x=labels, y=flags)))["data"][0]
+    _check(list(trace["x"]) == labels, "string x should pass through")
+    _check(list(trace["y"]) == flags, "bool y should pass through")
+
+    # Placeholder ("No data") figures have no traces and keep their annotation
+    payload = compact_figure(create_price_figure(pd.DataFrame(), ticker="SYN-USD"))
+    _check(payload["data"] == [], "placeholder should have no traces")
+    _check(payload["layout"]["annotations"][0]["text"] == "No data",
+           "placeholder annotation lost")
+
+
+def _time(fn: Callable[[], str], repeat: int) -> float:
+    samples: List[float] = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return statistics.median(samples)
+
+
+def _sizes(payload: bytes) -> str:
+    out = f"raw={len(payload) / 1024:9.1f} KiB  gzip={len(gzip.compress(payload, 6)) / 1024:8.1f} KiB"
+    if brotli is not None:
+        out += f"  br={len(brotli.compress(payload, quality=5)) / 1024:8.1f} KiB"
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--points", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    check_encoding()
+    print(f"encoding check: ok • engines: {', '.join(ENGINES)}"
+          f" • brotli: {'yes' if brotli is not None else 'no'}")
+    for n in args.points:
+        fig = create_price_figure(_synthetic_frame(n), ticker="SYN-USD",
+                                  time_offset_hours=2, time_label="UTC+02:00")
+        print(f"points={n}")
+        for engine in ENGINES:
+            variants = (
+                ("plain", lambda: to_json_plotly(fig, engine=engine)),
+                ("compact", lambda: to_json_plotly(compact_figure(fig), engine=engine)),
+            )
+            for name, fn in variants:
+                elapsed = _time(fn, args.repeat)
+                payload = fn().encode("utf-8")
+                print(f"  {engine:<6} {name:<8} {elapsed * 1000:8.2f} ms  {_sizes(payload)}")
+
+
+if __name__ == "__main__":
+    main()
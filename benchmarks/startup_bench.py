@@ -0,0 +1,175 @@
+"""Cold-start benchmark for the Dash / Streamlit entry points.
+
+Each run spawns a fresh interpreter so module caches are cold, then reports:
+- import time of the entry module
+- create_app() time (Dash only)
+- time-to-first-response for "/", "/_dash-layout" and the first figures
+  callback (POST /_dash-update-component) (Dash only, Flask test client)
+- which heavy dependencies were already imported at each point
+
+The figures callback runs with DataFetcher.fetch replaced by an offline stub
+(synthetic prices, no network) that still imports yfinance, so the deferred
+pandas / plotly / yfinance imports are included in its timing.
+
+Usage (from the repo root):
+    python benchmarks/startup_bench.py                # Dash, 5 runs
+    python benchmarks/startup_bench.py --runs 10
+    python benchmarks/startup_bench.py --target streamlit
+
+--target streamlit only times importing streamlit_app; rendering needs the
+Streamlit runtime, so no response time is measured for it.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = [
+    "pandas",
+    "yfinance",
+    "plotly.graph_objects",
+    "dash_bootstrap_components",
+    "yaml",
+]
+
+
+def _loaded_heavy() -> List[str]:
+    return [m for m in HEAVY_MODULES if m in sys.modules]
+
+
+def _offline_fetch(self, ticker: str, period: str, interval: str):
+    """Stand-in for DataFetcher.fetch: same imports, synthetic data, no network."""
+    import numpy as np
+    import pandas as pd
+    import yfinance  # noqa: F401  (the real fetch imports it on a cache miss)
+
+    ts = pd.date_range("2024-01-01", periods=288, freq="5min")
+    return pd.DataFrame({"ts": ts, "Close": np.linspace(1.0, 2.0, len(ts))})
+
+
+def _figures_request(app, config: Dict) -> Dict:
+    """Body of the browser's initial update_all_figures request."""
+    tickers = config.get("tickers", [])
+    # Let Dash tell us the callback key rather than re-deriving its id format
+    output = next(k for k in app.callback_map if "price-graph" in k)
+    return {
+        "output": output,
+        "outputs": [
+            [{"id": {"type": "price-graph", "ticker": t}, "property": "figure"}
+             for t in tickers],
+            {"id": "span-last-updated", "property": "children"},
+        ],
+        "inputs": [
+            {"id": "dd-period", "property": "value",
+             "value": config["defaults"]["period"]},
+            {"id": "dd-interval", "property": "value",
+             "value": config["defaults"]["interval"]},
+            {"id": "btn-refresh", "property": "n_clicks", "value": None},
+        ],
+        "state": [{"id": "store-tickers", "property": "data", "value": tickers}],
+        "changedPropIds": [],
+    }
+
+
+def _child_dash() -> Dict:
+    t0 = time.perf_counter()
+    import main  # noqa: E402  (import cost is what we measure)
+
+    t_import = time.perf_counter()
+    app = main.create_app()
+    t_create = time.perf_counter()
+
+    client = app.server.test_client()
+    resp_index = client.get("/")
+    t_index = time.perf_counter()
+    resp_layout = client.get("/_dash-layout")
+    t_layout = time.perf_counter()
+    heavy_at_layout = _loaded_heavy()
+
+    # Already imported by main; no import cost lands here
+    from py_components.config_loader import load_config
+    from py_components.data_fetcher import DataFetcher
+
+    DataFetcher.fetch = _offline_fetch
+    body = _figures_request(app, load_config("config/config.yaml"))
+    t_body = time.perf_counter()
+    resp_figures = client.post("/_dash-update-component", json=body)
+    t_figures = time.perf_counter()
+
+    return {
+        "import_s": t_import - t0,
+        "create_app_s": t_create - t_import,
+        "first_index_s": t_index - t0,
+        "first_layout_s": t_layout - t0,
+        # Exclude building the request body; it is not server work
+        "first_figures_s": t_figures - t0 - (t_body - t_layout),
+        "status": [resp_index.status_code, resp_layout.status_code,
+                   resp_figures.status_code],
+        "heavy_loaded_at_layout": heavy_at_layout,
+        "heavy_loaded": _loaded_heavy(),
+    }
+
+
+def _child_streamlit() -> Dict:
+    t0 = time.perf_counter()
+    import streamlit_app  # noqa: F401,E402
+
+    t_import = time.perf_counter()
+    return {
+        "import_s": t_import - t0,
+        "heavy_loaded": _loaded_heavy(),
+    }
+
+
+def _run_child(target: str) -> Dict:
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", "--target", target],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # The child prints exactly one JSON line last; anything before is app noise
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target", choices=["dash", "streamlit"], default="dash")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        sys.path.insert(0, ROOT)
+        os.chdir(ROOT)
+        result = _child_dash() if args.target == "dash" else _child_streamlit()
+        print(json.dumps(result))
+        return
+
+    results = [_run_child(args.target) for _ in range(max(1, args.runs))]
+    print(f"target={args.target} runs={len(results)}")
+    for key in ("import_s", "create_app_s", "first_index_s", "first_layout_s",
+                "first_figures_s"):
+        values = [r[key] for r in results if key in r]
+        if values:
+            print(f"  {key:<16} median={statistics.median(values) * 1000:8.1f} ms"
+                  f"  min={min(values) * 1000:8.1f} ms")
+    last = results[-1]
+    if "status" in last:
+        print(f"  HTTP status (index, layout, figures): {last['status']}")
+    if "heavy_loaded_at_layout" in last:
+        print(f"  heavy modules loaded at first layout:  {last['heavy_loaded_at_layout']}")
+    print(f"  heavy modules loaded at end of run:    {last['heavy_loaded']}")
+
+
+if __name__ == "__main__":
+    main()
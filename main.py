@@ -1,5 +1,6 @@
 from dash import Dash
 import dash_bootstrap_components as dbc
+import importlib.util
 import logging
 
 from py_components.config_loader import load_config
@@ -22,11 +23,18 @@ def create_app() -> Dash:
     theme_name = getattr(dbc.themes, config["ui"].get(
         "bootstrap_theme", "DARKLY"), dbc.themes.DARKLY)
 
+    # gzip/brotli responses via flask-compress (brotli used if installed)
+    compress = bool((config.get("server") or {}).get("compress", False))
+    if compress and importlib.util.find_spec("flask_compress") is None:
+        logger.warning("server.compress is enabled but flask-compress is not installed")
+        compress = False
+
     app = Dash(
         __name__,
         external_stylesheets=[theme_name],
         suppress_callback_exceptions=True,
         title="Crypto Dashboard",
+        compress=compress,
     )
 
     cache = TTLCache(ttl_seconds=int(config.get("cache_ttl_seconds", 600)))
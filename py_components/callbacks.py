@@ -1,10 +1,14 @@
+from __future__ import annotations
 from datetime import datetime
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
 from dash import Input, Output, State, ALL
-import pandas as pd
 
 from .data_fetcher import DataFetcher
 from .chart_factory import create_price_figure
+from .figure_serializer import compact_figure
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 def register_callbacks(app, config: Dict, fetcher: DataFetcher):
@@ -15,6 +19,9 @@ def register_callbacks(app, config: Dict, fetcher: DataFetcher):
     time_offset_hours: int = int(config.get(
         "ui", {}).get("time_offset_hours", 0))
     time_label: str | None = config.get("ui", {}).get("time_label", None)
+    # Send x/y as base64 typed arrays instead of ISO strings / decimal text
+    compact_figures: bool = bool(config.get(
+        "ui", {}).get("compact_figures", True))
 
     @app.callback(
         Output({"type": "price-graph", "ticker": ALL}, "figure"),
@@ -39,7 +46,7 @@ def register_callbacks(app, config: Dict, fetcher: DataFetcher):
                 time_offset_hours=time_offset_hours,   # <-- pass offset
                 time_label=time_label,                 # <-- optional label
             )
-            figures.append(fig)
+            figures.append(compact_figure(fig) if compact_figures else fig)
 
         now_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         return figures, f"Last update: {now_str}"
@@ -1,7 +1,10 @@
 # py_components/chart_factory.py
-from typing import Optional
-import pandas as pd
-import plotly.graph_objects as go
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import plotly.graph_objects as go
 
 
 def create_price_figure(
@@ -13,6 +16,10 @@ def create_price_figure(
     line_color: Optional[str] = None,
 ) -> go.Figure:
     """Create a line chart for normalized df with ['ts','Close'] or a placeholder."""
+    # Imported lazily: plotly/pandas dominate cold-start import time
+    import pandas as pd
+    import plotly.graph_objects as go
+
     fig = go.Figure()
 
     def _no_data(msg: str = "No data"):
@@ -1,9 +1,14 @@
-import yaml
+import copy
+import os
+from functools import lru_cache
 from typing import Dict
 
+import yaml
+
 
-def load_config(path: str) -> Dict:
-    """Load YAML config as a dict, with very light sanity checks."""
+@lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime: float) -> Dict:
+    """Parse + default the YAML once per (path, mtime); callers get a copy."""
     with open(path, "r", encoding="utf-8") as f:
         cfg = yaml.safe_load(f)
 
@@ -20,3 +25,13 @@ def load_config(path: str) -> Dict:
     cfg["ui"].setdefault("chart_height", 350)
     cfg.setdefault("cache_ttl_seconds", 600)
     return cfg
+
+
+def load_config(path: str) -> Dict:
+    """Load YAML config as a dict, with very light sanity checks.
+
+    The parsed result is cached per file and invalidated when the file's
+    modification time changes (Streamlit calls this on every rerun).
+    """
+    path = os.path.abspath(path)
+    return copy.deepcopy(_load_config_cached(path, os.path.getmtime(path)))
@@ -1,15 +1,28 @@
+from __future__ import annotations
+
 import logging
-import pandas as pd
-import yfinance as yf
+from typing import TYPE_CHECKING
 
 from .utils_cache import TTLCache
-from .data_utils import normalize_timeseries
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 logger = logging.getLogger("crypto_dash")
 
 
+def _empty_frame() -> pd.DataFrame:
+    import pandas as pd
+
+    return pd.DataFrame(columns=["ts", "Close"])
+
+
 class DataFetcher:
-    """Fetches price data via yfinance with a tiny TTL cache and robust fallbacks."""
+    """Fetches price data via yfinance with a tiny TTL cache and robust fallbacks.
+
+    pandas / yfinance are imported on first use, not at module load, so the
+    app can start serving its layout before the data stack is loaded.
+    """
 
     def __init__(self, cache: TTLCache):
         self.cache = cache
@@ -18,8 +31,12 @@ class DataFetcher:
         return f"{ticker}|{period}|{interval}"
 
     def _normalize_single(self, raw: pd.DataFrame) -> pd.DataFrame:
+        import pandas as pd
+
+        from .data_utils import normalize_timeseries
+
         if raw is None or raw.empty:
-            return pd.DataFrame(columns=["ts", "Close"])
+            return _empty_frame()
         if isinstance(raw.columns, pd.MultiIndex):
             raw.columns = ["_".join([str(c) for c in col if c])
                            for col in raw.columns]
@@ -33,8 +50,10 @@ class DataFetcher:
             logger.info(f"[fetch] cache hit: {key} (rows={len(cached)})")
             return cached
 
+        import yfinance as yf
+
         logger.info(f"[fetch] downloading: {key}")
-        df_norm = pd.DataFrame(columns=["ts", "Close"])
+        df_norm = _empty_frame()
 
         # Attempt 1: yf.download
         try:
@@ -0,0 +1,63 @@
+# py_components/figure_serializer.py
+from __future__ import annotations
+import base64
+from typing import TYPE_CHECKING, Any, Dict
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
+# numpy dtype -> plotly.js typed-array dtype code (plotly.js >= 2.28)
+_TYPED_ARRAY_CODES = {
+    "float64": "f8",
+    "float32": "f4",
+    "int32": "i4",
+    "uint32": "u4",
+    "int16": "i2",
+    "uint16": "u2",
+    "int8": "i1",
+    "uint8": "u1",
+}
+
+
+def encode_typed_array(values) -> Dict[str, str]:
+    """Encode a numeric array as a plotly.js base64 typed array {dtype, bdata}.
+
+    int64/uint64 are not supported by plotly.js and are sent as float64.
+    """
+    import numpy as np
+
+    arr = np.asarray(values)
+    if arr.dtype.name not in _TYPED_ARRAY_CODES:
+        arr = arr.astype("float64")
+    arr = np.ascontiguousarray(arr, dtype=arr.dtype.newbyteorder("<"))
+    return {
+        "dtype": _TYPED_ARRAY_CODES[arr.dtype.name],
+        "bdata": base64.b64encode(arr.tobytes()).decode("ascii"),
+    }
+
+
+def _compact_axis(values):
+    """Typed-array encode 1-D numeric arrays; leave anything else as is.
+
+    Datetime x stays as-is (serialized as naive ISO strings): plotly.js reads
+    numeric x on a date axis in the viewer's local timezone, which would shift
+    every chart by the browser's UTC offset.
+    """
+    import numpy as np
+
+    if values is None or isinstance(values, (dict, str)):
+        return values
+    arr = np.asarray(values)
+    if arr.ndim == 1 and arr.dtype.kind in "iuf":
+        return encode_typed_array(arr)
+    return values
+
+
+def compact_figure(fig: go.Figure) -> Dict[str, Any]:
+    """Plain figure dict with numeric x/y sent as base64 typed arrays."""
+    payload = fig.to_plotly_json()
+    for trace in payload.get("data", []):
+        for key in ("x", "y"):
+            if trace.get(key) is not None:
+                trace[key] = _compact_axis(trace[key])
+    return payload